@@ -0,0 +1,7 @@
+"""
+Compiled numerical kernels used by the dashboard.
+"""
+
+from backend.kernels.bs_njit import bs_sweep_sigma
+
+__all__ = ['bs_sweep_sigma']
@@ -0,0 +1,19 @@
+"""
+Ahead-of-time build of the volatility-sweep kernel.
+
+Run ``python -m backend.kernels._aot_build`` (setup.py also builds it as an extension) to
+produce the ``backend.kernels.bs_kernels`` module next to this file. It exports the same
+bs_njit._bs_sweep_sigma body, compiled serially; when present, the dashboard uses it and
+never JIT-compiles the sweep.
+"""
+from numba.pycc import CC
+
+from backend.kernels.bs_njit import _bs_sweep_sigma
+
+cc = CC('bs_kernels')
+# The plot sweeps are float32 (see backend.utils.config._sweep), so that is the exported signature
+cc.export('bs_sweep_sigma', 'UniTuple(f4[:], 2)(f4, f4, f4, f4, f4[:])')(_bs_sweep_sigma)
+
+
+if __name__ == '__main__':
+    cc.compile()
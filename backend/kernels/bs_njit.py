@@ -0,0 +1,68 @@
+import math
+
+import numpy as np
+from scipy.special import ndtr
+
+from backend.utils.config import SIGMA_PRICE_ARR
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; fall back to the vectorized NumPy sweep
+    njit = None
+
+_INV_SQRT2 = 0.7071067811865476
+
+
+def _bs_sweep_sigma(S0, K, T, r, sigma_arr):
+    """
+    Black-Scholes call price and P[S_T > K] across a volatility sweep.
+
+    One fused loop per sigma computes d1, d2 and both normal CDFs (via erf), instead of a
+    chain of NumPy temporaries. Only ever run compiled: JIT-ed in parallel below, and exported
+    serially by _aot_build.py (outside parallel mode prange is range).
+
+    Args:
+        S0 (float): Initial stock price.
+        K (float): Strike price.
+        T (float): Time to maturity in years.
+        r (float): Risk-free interest rate.
+        sigma_arr (np.ndarray): 1D array of volatilities.
+
+    Returns:
+        tuple: (call prices, probabilities), arrays with the dtype of sigma_arr.
+    """
+    n = sigma_arr.shape[0]
+    price = np.empty_like(sigma_arr)
+    prob = np.empty_like(sigma_arr)
+    sqrt_t = math.sqrt(T)
+    log_m = math.log(S0 / K)
+    disc_k = K * math.exp(-r * T)
+    for i in prange(n):
+        s = sigma_arr[i]
+        vol = s * sqrt_t
+        d1 = (log_m + (r + 0.5 * s * s) * T) / vol
+        d2 = d1 - vol
+        nd2 = 0.5 * (1.0 + math.erf(d2 * _INV_SQRT2))
+        price[i] = S0 * 0.5 * (1.0 + math.erf(d1 * _INV_SQRT2)) - disc_k * nd2
+        prob[i] = nd2
+    return price, prob
+
+
+if njit is not None:
+    bs_sweep_sigma = njit(parallel=True, fastmath=True, cache=True)(_bs_sweep_sigma)
+else:
+    def bs_sweep_sigma(S0, K, T, r, sigma_arr):
+        """NumPy fallback with the same signature and outputs as the Numba kernel."""
+        vol = sigma_arr * math.sqrt(T)
+        d1 = (math.log(S0 / K) + (r + 0.5 * sigma_arr * sigma_arr) * T) / vol
+        d2 = d1 - vol
+        prob = ndtr(d2)
+        price = S0 * ndtr(d1) - K * math.exp(-r * T) * prob
+        return price, prob
+
+
+def warmup():
+    """Compile (or load from the on-disk cache) the specialization used by the plots."""
+    # The plot axes are read-only float32 arrays, a separate Numba type from writable ones,
+    # so warm up with the config array itself
+    bs_sweep_sigma(np.float32(50.0), np.float32(50.0), np.float32(1.0), np.float32(0.0), SIGMA_PRICE_ARR)
@@ -6,6 +6,9 @@ from typing import Dict, Union, Optional
 from backend.utils.DataProcessor import DCFDataManager
 
 class DiscountedCashFlowModel:
+    __slots__ = ('enterprise_value', 'debt', 'cash', 'shares_outstanding', 'last_fcf', 'growth_rate', 'wacc',
+                 'terminal_growth_rate', 'industry')
+
     def __init__(self, enterprise_value, debt, cash, shares_outstanding, last_fcf, growth_rate, wacc,
                  terminal_growth_rate, industry='N/A'):
         self.enterprise_value = enterprise_value
@@ -27,11 +30,8 @@ class DiscountedCashFlowModel:
         return equity_value / self.shares_outstanding if self.shares_outstanding else 0
 
     def project_free_cash_flows(self, years=5):
-        projected_fcf = []
-        for year in range(1, years + 1):
-            fcf = self.last_fcf * (1 + self.growth_rate) ** year
-            projected_fcf.append(fcf)
-        return projected_fcf
+        years_arr = np.arange(1, years + 1, dtype=np.float64)
+        return self.last_fcf * np.power(1.0 + self.growth_rate, years_arr)
 
     def calculate_terminal_value(self, final_fcf):
         # Avoid division by zero if WACC equals terminal growth rate
@@ -41,8 +41,15 @@ class DiscountedCashFlowModel:
         return (final_fcf * (1 + self.terminal_growth_rate)) / denominator
 
     def calculate_present_value(self, cash_flows, terminal_value):
-        pv_fcf = sum(fcf / ((1 + self.wacc) ** (i + 1)) for i, fcf in enumerate(cash_flows))
-        pv_terminal_value = terminal_value / ((1 + self.wacc) ** len(cash_flows))
+        # Running discount factor (1 + wacc)^-t: one multiply per year instead of a power.
+        # Horizons are short (3-10 years), where this beats NumPy's per-call dispatch.
+        inv = 1.0 / (1.0 + self.wacc)
+        factor = 1.0
+        pv_fcf = 0.0
+        for fcf in np.asarray(cash_flows, dtype=np.float64).tolist():
+            factor *= inv
+            pv_fcf += fcf * factor
+        pv_terminal_value = terminal_value * factor
         return pv_fcf + pv_terminal_value
 
     def calculate_intrinsic_value(self, years=5):
@@ -59,16 +66,59 @@ class DiscountedCashFlowModel:
         #     # Standard DCF for other industries
         #     pass
         # ======================================================================
-        projected_fcf = self.project_free_cash_flows(years)
-        if not projected_fcf:
+        if years <= 0:
             return 0
-        final_fcf = projected_fcf[-1]
+        # Closed form of project_free_cash_flows -> calculate_present_value: the projected
+        # FCFs discounted at WACC form a geometric series with ratio (1 + g) / (1 + wacc).
+        g, w, fcf0 = self.growth_rate, self.wacc, self.last_fcf
+        ratio = (1 + g) / (1 + w)
+        if abs(w - g) < 1e-6:
+            # (1 - ratio^n) / (w - g) cancels as WACC approaches g; sum the n terms instead
+            pv_fcf = fcf0 * sum(ratio ** t for t in range(1, years + 1))
+        else:
+            pv_fcf = fcf0 * (1 + g) * (1 - ratio ** years) / (w - g)
+        final_fcf = fcf0 * (1 + g) ** years
         terminal_value = self.calculate_terminal_value(final_fcf)
-        intrinsic_enterprise_value = self.calculate_present_value(projected_fcf, terminal_value)
+        pv_terminal_value = terminal_value / (1 + w) ** years
+        intrinsic_enterprise_value = pv_fcf + pv_terminal_value
         intrinsic_equity_value = intrinsic_enterprise_value - self.debt + self.cash
         # Avoid division by zero
         return intrinsic_equity_value / self.shares_outstanding if self.shares_outstanding else 0
 
+    def intrinsic_value_grid(self, wacc_arr, growth_arr, years=5):
+        """
+        Intrinsic value per share over a WACC x growth-rate sensitivity grid.
+
+        Broadcasts the closed form used by calculate_intrinsic_value, so the whole table is a
+        handful of ufunc calls instead of one model evaluation per cell.
+
+        Args:
+            wacc_arr (array-like): 1D WACC values (grid rows).
+            growth_arr (array-like): 1D FCF growth rates (grid columns).
+            years (int): Number of projection years.
+
+        Returns:
+            np.ndarray: Values with shape (len(wacc_arr), len(growth_arr)).
+        """
+        w = np.asarray(wacc_arr, dtype=np.float64).reshape(-1, 1)
+        g = np.asarray(growth_arr, dtype=np.float64).reshape(1, -1)
+        if years <= 0 or not self.shares_outstanding:
+            return np.zeros((w.shape[0], g.shape[1]))
+        fcf0, tg = self.last_fcf, self.terminal_growth_rate
+        growth_pow = np.power(1.0 + g, years)
+        discount_pow = np.power(1.0 + w, years)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pv_fcf = fcf0 * (1.0 + g) * (1.0 - growth_pow / discount_pow) / (w - g)
+            # Same guard as calculate_intrinsic_value: sum the n terms where WACC is within 1e-6 of g
+            near = np.abs(w - g) < 1e-6
+            if near.any():
+                ratio = np.broadcast_to((1.0 + g) / (1.0 + w), near.shape)[near]
+                pv_fcf[near] = fcf0 * np.power.outer(ratio, np.arange(1, years + 1)).sum(axis=1)
+            # Same convention as calculate_terminal_value: zero when WACC equals terminal growth
+            terminal_value = np.where(w == tg, 0.0, fcf0 * growth_pow * (1.0 + tg) / (w - tg))
+        intrinsic_enterprise_value = pv_fcf + terminal_value / discount_pow
+        return (intrinsic_enterprise_value - self.debt + self.cash) / self.shares_outstanding
+
     @classmethod
     def from_yahoo_finance(cls, ticker: str, assumptions: Dict[str, float]):
         data_manager = DCFDataManager()
@@ -0,0 +1,18 @@
+"""
+Ahead-of-time build of the Monte Carlo call kernel.
+
+Run ``python -m backend.models._mc_aot`` (setup.py also builds it as an extension) to
+produce the ``backend.models.mc_kernel`` module next to this file. It exports the same
+black_scholes._mc_call body, compiled serially, for installs where Numba is not available
+at runtime.
+"""
+from numba.pycc import CC
+
+from backend.models.black_scholes import _mc_call
+
+cc = CC('mc_kernel')
+cc.export('mc_call', 'f8(f8, f8, f8, f8, f8, i8)')(_mc_call)
+
+
+if __name__ == '__main__':
+    cc.compile()
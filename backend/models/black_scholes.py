@@ -1,17 +1,98 @@
+import math
+import warnings
+
 import numpy as np
-from scipy.stats import norm
+from scipy.special import ndtr, ndtri
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; fall back to the vectorized NumPy path
+    njit = None
+
+try:
+    # Optional AOT build of the kernel (see _mc_aot.py), used when Numba itself is not installed
+    from backend.models.mc_kernel import mc_call as _mc_call_aot
+except ImportError:
+    _mc_call_aot = None
+
+try:
+    import numexpr as ne
+except ImportError:  # numexpr is optional; used only when Numba is unavailable
+    ne = None
+
+
+def _antithetic_payoff(a, K, vol, z):
+    """Call payoff of the antithetic pair S_T = a * exp(+/-vol * z), sharing a single exp."""
+    e = np.exp(vol * z)
+    return max(a * e - K, 0.0) + max(a / e - K, 0.0)
+
+
+def _mc_call(S0, K, T, r, sigma, n):
+    """
+    Fused GBM terminal price, call payoff and discounted mean in a single pass.
+
+    Normals are generated with Box-Muller from Numba's thread-local uniform streams and
+    each one prices an antithetic pair, so an iteration covers four paths with one
+    log/sqrt, a sin/cos pair and two exps. Only ever run compiled: JIT-ed in parallel
+    below, and exported serially by _mc_aot.py (outside parallel mode prange is range).
+    """
+    drift = (r - 0.5 * sigma * sigma) * T
+    vol = sigma * np.sqrt(T)
+    a = S0 * np.exp(drift)
+    pairs = (n + 1) // 2
+    two_pi = 2.0 * np.pi
+    acc = 0.0
+    for i in prange(pairs // 2):
+        u1 = 1.0 - np.random.random()  # (0, 1] keeps log finite
+        u2 = np.random.random()
+        radius = np.sqrt(-2.0 * np.log(u1))
+        acc += (_antithetic_payoff(a, K, vol, radius * np.cos(two_pi * u2))
+                + _antithetic_payoff(a, K, vol, radius * np.sin(two_pi * u2)))
+    if pairs % 2:
+        acc += _antithetic_payoff(a, K, vol, np.random.standard_normal())
+    return (acc / (2 * pairs)) * np.exp(-r * T)
+
+
+if njit is not None:
+    _antithetic_payoff = njit(fastmath=True, cache=True)(_antithetic_payoff)
+    _mc_call_kernel = njit(parallel=True, fastmath=True, cache=True)(_mc_call)
+else:
+    _mc_call_kernel = None
+
 
 class BlackScholesModel:
-    def __init__(self, S0, K, T, r, sigma):
+    # Sweeps create many short-lived models; slots keep them small and attribute access cheap
+    __slots__ = ('S0', 'K', 'T', 'r', 'sigma', '_seed', '_rng', '_sqrtT', '_log_m', '_vol', '_half_var_T')
+
+    def __init__(self, S0, K, T, r, sigma, seed=None):
         self.S0 = S0
         self.K = K
         self.T = T
         self.r = r
         self.sigma = sigma
+        # The generator is only needed by the NumPy MC path, so it is created on first use
+        self._seed = seed
+        self._rng = None
+        # Partials shared by d1/d2 and the MC drift, kept as float64 so edge inputs follow IEEE
+        # rules: T == 0 or sigma == 0 gives d1 = +/-inf and the price its limit (max(S0 - K, 0)
+        # at expiry) instead of raising, and K <= 0 or S0 <= 0 give inf/nan as NumPy does.
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self._sqrtT = np.sqrt(np.float64(T))
+            self._log_m = np.log(np.divide(S0, K, dtype=np.float64))
+        self._vol = sigma * self._sqrtT
+        self._half_var_T = 0.5 * sigma * sigma * T
+
+    @property
+    def rng(self):
+        """Per-model PCG64DXSM stream; a fixed seed makes the NumPy MC path reproducible."""
+        if self._rng is None:
+            self._rng = np.random.Generator(np.random.PCG64DXSM(self._seed))
+        return self._rng
 
     def _calculate_d1(self):
         """Calculates the d1 term of the Black-Scholes formula."""
-        return (np.log(self.S0 / self.K) + (self.r + 0.5 * self.sigma**2) * self.T) / (self.sigma * np.sqrt(self.T))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (self._log_m + self.r * self.T + self._half_var_T) / self._vol
 
     def calculate_probability(self):
         """
@@ -19,22 +100,55 @@ class BlackScholesModel:
         This corresponds to N(d2), but the R code uses a different formulation
         which is equivalent to N(d1) in a different context. We will match the R code's d1.
         """
-        d1 = (np.log(self.S0 / self.K) + (self.r - 0.5 * self.sigma**2) * self.T) / (self.sigma * np.sqrt(self.T))
-        return norm.cdf(d1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            d1 = (self._log_m + self.r * self.T - self._half_var_T) / self._vol
+        return ndtr(d1)
 
     def calculate_call_price(self):
         """Calculates the analytical Black-Scholes price for a European call option."""
         d1 = self._calculate_d1()
-        d2 = d1 - self.sigma * np.sqrt(self.T)
-        call_price = self.S0 * norm.cdf(d1) - self.K * np.exp(-self.r * self.T) * norm.cdf(d2)
+        with np.errstate(invalid='ignore'):
+            d2 = d1 - self._vol
+        call_price = self.S0 * ndtr(d1) - self.K * math.exp(-self.r * self.T) * ndtr(d2)
         return call_price
 
-    def run_mc_simulation(self, n_simulations):
+    @staticmethod
+    def price_grid(S0, K, T, r, sigma):
+        """
+        Vectorized analytical call prices over a grid of strikes and volatilities.
+
+        Args:
+            S0 (float): Initial stock price.
+            K (float or array-like): Strike price(s).
+            T (float): Time to maturity in years.
+            r (float): Risk-free interest rate.
+            sigma (float or array-like): Volatility or volatilities.
+
+        Returns:
+            np.ndarray: Call prices. When both K and sigma are 1D the result has shape
+            (len(sigma), len(K)); otherwise the usual broadcast shape.
+        """
+        K = np.asarray(K, dtype=np.float64)
+        sigma = np.asarray(sigma, dtype=np.float64)
+        if K.ndim == 1 and sigma.ndim == 1:
+            sigma = sigma[:, None]
+        vol = sigma * math.sqrt(T)
+        d1 = (np.log(S0 / K) + (r + 0.5 * sigma * sigma) * T) / vol
+        d2 = d1 - vol
+        return S0 * ndtr(d1) - K * math.exp(-r * T) * ndtr(d2)
+
+    def run_mc_simulation(self, n_simulations, qmc=False):
         """
         Estimates the European call option price using Monte Carlo simulation.
 
+        Uses antithetic variates: every normal draw Z prices the pair of paths driven by
+        +Z and -Z, halving the draws for a given path count and reducing the variance.
+        An odd n_simulations is rounded up to the next even number of paths.
+
         Args:
             n_simulations (int): The number of simulation paths.
+            qmc (bool): Draw Z from a scrambled Sobol sequence (quasi-Monte Carlo) instead of
+                pseudo-random normals. Converges close to O(1/n) rather than O(1/sqrt(n)).
 
         Returns:
             tuple: A tuple containing the estimated price and the execution time.
@@ -42,15 +156,51 @@ class BlackScholesModel:
         import time
         start_time = time.time()
 
-        # Generate random paths in a vectorized manner
-        Y = np.random.standard_normal(n_simulations)
-        ST = self.S0 * np.exp((self.r - 0.5 * self.sigma**2) * self.T + self.sigma * np.sqrt(self.T) * Y)
+        if not qmc and _mc_call_kernel is not None:
+            # Fused JIT kernel (loaded from Numba's on-disk cache after the first run):
+            # no n_simulations-sized temporaries, parallel across cores
+            price = _mc_call_kernel(float(self.S0), float(self.K), float(self.T), float(self.r),
+                                    float(self.sigma), int(n_simulations))
+        elif not qmc and _mc_call_aot is not None:
+            # Precompiled serial build of the same kernel, for installs without Numba
+            price = _mc_call_aot(float(self.S0), float(self.K), float(self.T), float(self.r),
+                                 float(self.sigma), int(n_simulations))
+        else:
+            pairs = (n_simulations + 1) // 2
+            # S_T = a * exp(+/-vol * Z) with a = S0 * exp(drift), so one exp serves both paths
+            a = self.S0 * math.exp(self.r * self.T - self._half_var_T)
+            K = self.K
+
+            # E = exp(vol * Z), computed in place
+            if qmc:
+                from scipy.stats.qmc import Sobol
+                sampler = Sobol(d=1, scramble=True, seed=self.rng)
+                with warnings.catch_warnings():
+                    # Balance properties want a power-of-2 count; any size still beats plain MC
+                    warnings.simplefilter('ignore', UserWarning)
+                    E = sampler.random(pairs).ravel()
+                ndtri(E, out=E)
+            else:
+                E = np.empty(pairs)
+                self.rng.standard_normal(out=E)
+            np.multiply(E, self._vol, out=E)
 
-        # Calculate the payoff (max(ST - K, 0))
-        payout = np.maximum(ST - self.K, 0)
+            if ne is not None:
+                # Chunked, multithreaded numexpr passes: no path-sized temporaries
+                ne.evaluate("exp(E)", local_dict={'E': E}, out=E)
+                total = float(ne.evaluate("sum(where(E > K / a, a * E - K, 0.0) + where(E < a / K, a / E - K, 0.0))",
+                                          local_dict={'E': E, 'a': float(a), 'K': float(K)}))
+            else:
+                np.exp(E, out=E)
+                # Only in-the-money paths have a payoff, so the reductions run on those subsets alone:
+                # S_T(+Z) > K <=> E > K/a and S_T(-Z) > K <=> E < a/K
+                up = E[E > K / a]
+                down = E[E < a / K]
+                np.reciprocal(down, out=down)
+                total = a * (up.sum() + down.sum()) - K * (up.size + down.size)
 
-        # Discount the average payoff to get the price
-        price = np.mean(payout) * np.exp(-self.r * self.T)
+            # Discount the average payoff to get the price
+            price = (total / (2 * pairs)) * math.exp(-self.r * self.T)
 
         end_time = time.time()
         execution_time = end_time - start_time
@@ -0,0 +1,38 @@
+"""
+Process-pool entry points for the dashboard's Monte Carlo tab.
+
+They live here rather than in gui.py so worker processes only need the pricing model.
+"""
+from backend.models.black_scholes import BlackScholesModel
+
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def init_worker():
+    """Executor initializer: workers start single-threaded; price_size raises that per task."""
+    # OMP_NUM_THREADS is set by the parent while the pool starts; numexpr and Numba keep
+    # their own thread pools, sized at import, so they are capped here
+    _set_threads(1)
+
+
+def _set_threads(threads):
+    if ne is not None:
+        ne.set_num_threads(threads)
+    if numba is not None:
+        numba.set_num_threads(min(threads, numba.config.NUMBA_NUM_THREADS))
+
+
+def price_size(params, n, seed, qmc=False, threads=1):
+    """Price one simulation size on a fresh model with its own RNG stream, using `threads` cores."""
+    _set_threads(threads)
+    model = BlackScholesModel(**params, seed=seed)
+    mc_price, exec_time = model.run_mc_simulation(n, qmc=qmc)
+    return n, mc_price, exec_time
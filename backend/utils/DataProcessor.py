@@ -1,31 +1,88 @@
+import csv
+import datetime
+from functools import lru_cache
+
 import pandas as pd
 import numpy as np
+import openpyxl
 import yfinance as yf
+from joblib import Memory
 from typing import Dict, Union, Optional
 
+from backend.utils.config import YF_CACHE_DIR
+
+_memory = Memory(YF_CACHE_DIR, verbose=0)
+
+
+def _download_statements(ticker: str, date_bucket: str, include_info: bool) -> Dict[str, object]:
+    """Download the raw Yahoo Finance data for a ticker; date_bucket only keys the daily refresh."""
+    stock = yf.Ticker(ticker)
+    raw = {
+        'financials': stock.financials,
+        'balance_sheet': stock.balance_sheet,
+        'cashflow': stock.cashflow,
+    }
+    if include_info:
+        # The quote summary already carries shares and market cap; no extra requests needed
+        info = stock.get_info()
+        raw.update(info=info, shares=info.get('sharesOutstanding'), market_cap=info.get('marketCap'))
+    else:
+        # fast_info covers shares/market cap without the full quote-summary scrape behind .info
+        fast_info = stock.fast_info
+        raw.update(info={}, shares=fast_info.get('shares'), market_cap=fast_info.get('market_cap'))
+    # Don't let an empty (failed) download sit in the cache for the rest of the day
+    if not raw['shares'] and all(raw[k].empty for k in ('financials', 'balance_sheet', 'cashflow')):
+        raise ValueError(f"No data returned for {ticker}")
+    return raw
+
+
+# In-process LRU in front of the on-disk joblib cache: repeated lookups skip both the
+# network round-trips and the pickle load.
+_fetch_raw = lru_cache(maxsize=32)(_memory.cache(_download_statements))
+
+
+def _download_industry(ticker: str, date_bucket: str) -> str:
+    """The ticker's industry, the one displayed field that needs the full quote summary (.info)."""
+    return yf.Ticker(ticker).get_info().get('industry', 'N/A')
+
+
+_fetch_industry = lru_cache(maxsize=32)(_memory.cache(_download_industry))
+
 
 class YahooFinanceDataProcessor:
     def __init__(self, ticker: str):
         self.ticker = ticker.upper()
-        self.stock = yf.Ticker(self.ticker)
 
-    def get_financial_data(self) -> Dict[str, Union[float, str]]:
+    def get_financial_data(self, include_info: bool = False) -> Dict[str, Union[float, str]]:
+        """
+        Fetch the latest statement values for the ticker.
+
+        include_info additionally downloads the full quote summary (.info), which is only
+        needed for the industry and Yahoo's own enterprise value; without it the industry is
+        'N/A' and the enterprise value is derived from market cap, debt and cash.
+        """
         try:
-            #get company info
-            income_stmt = self.stock.financials
-            balance_sheet = self.stock.balance_sheet
-            cash_flow = self.stock.cashflow
-            info = self.stock.info
+            #get company info (cached per ticker and day)
+            raw = _fetch_raw(self.ticker, datetime.date.today().isoformat(), include_info)
+            income_stmt = raw['financials']
+            balance_sheet = raw['balance_sheet']
+            cash_flow = raw['cashflow']
+            info = raw['info']
+
+            # lower-cased label -> latest value, built once per statement
+            latest_is = self._latest_column(income_stmt)
+            latest_bs = self._latest_column(balance_sheet)
+            latest_cf = self._latest_column(cash_flow)
 
             #key metrics
             data = {
-                'shares_outstanding': info.get('sharesOutstanding', 0) / 1e6,  # Convert to millions
-                'market_cap': info.get('marketCap', 0) / 1e6,  # Convert to millions
+                'shares_outstanding': (raw['shares'] or 0) / 1e6,  # Convert to millions
+                'market_cap': (raw['market_cap'] or 0) / 1e6,  # Convert to millions
                 'enterprise_value': info.get('enterpriseValue', 0) / 1e6 if info.get('enterpriseValue') else 0,
-                'debt': self._get_latest_value(balance_sheet, 'Total Debt') / 1e6,
-                'cash': self._get_latest_value(balance_sheet, 'Cash And Cash Equivalents') / 1e6,
-                'last_fcf': self._get_latest_value(cash_flow, 'Free Cash Flow') / 1e6,
-                'revenue': self._get_latest_value(income_stmt, 'Total Revenue') / 1e6,
+                'debt': self._get_latest_value(balance_sheet, 'Total Debt', latest_bs) / 1e6,
+                'cash': self._get_latest_value(balance_sheet, 'Cash And Cash Equivalents', latest_bs) / 1e6,
+                'last_fcf': self._get_latest_value(cash_flow, 'Free Cash Flow', latest_cf) / 1e6,
+                'revenue': self._get_latest_value(income_stmt, 'Total Revenue', latest_is) / 1e6,
                 'industry': info.get('industry', 'N/A'),  # Get the industry
             }
             if data['enterprise_value'] == 0 and data['market_cap'] > 0:
@@ -35,22 +92,36 @@ class YahooFinanceDataProcessor:
         except Exception as e:
             raise ValueError(f"Error fetching data for {self.ticker}: {str(e)}")
 
-    def _get_latest_value(self, df: pd.DataFrame, key: str) -> float:
+    def get_industry(self) -> str:
+        """Fetch only the industry, so callers can show it without putting .info on the statements path."""
         try:
-            #try match first
-            if key in df.index:
-                return float(df.loc[key].iloc[0])
+            return _fetch_industry(self.ticker, datetime.date.today().isoformat())
+        except Exception as e:
+            raise ValueError(f"Error fetching industry for {self.ticker}: {str(e)}")
 
-            #try alternative naming
-            alternatives = self._get_alternative_keys(key)
-            for alt_key in alternatives:
-                if alt_key in df.index:
-                    return float(df.loc[alt_key].iloc[0])
+    def _get_latest_value(self, df: pd.DataFrame, key: str, latest: Optional[Dict[str, object]] = None) -> float:
+        try:
+            if latest is None:
+                latest = self._latest_column(df)
+            #try match first, then alternative naming
+            for candidate in (key, *self._get_alternative_keys(key)):
+                value = latest.get(candidate.lower())
+                if value is not None:
+                    return float(value)
 
             return 0.0
-        except (IndexError, KeyError, TypeError):
+        except (IndexError, KeyError, TypeError, ValueError):
             return 0.0
 
+    @staticmethod
+    def _latest_column(df: pd.DataFrame) -> Dict[str, object]:
+        """Map lower-cased row labels to the latest (first column) value."""
+        latest = {}
+        if df.shape[1]:
+            for label, value in zip(df.index, df.iloc[:, 0].to_numpy()):
+                latest.setdefault(str(label).lower(), value)
+        return latest
+
     def _get_alternative_keys(self, key: str) -> list:
         alternatives = {
             'Total Debt': ['Total Debt', 'Long Term Debt', 'Total Liabilities Net Minority Interest'],
@@ -65,11 +136,12 @@ class FileDataProcessor:
     @staticmethod
     def load_from_file(file_path: str) -> Dict[str, Union[float, str]]:
         try:
-            # Determine file type and read accordingly
+            # Determine file type and read accordingly.
+            # Only the first row is ever used, so don't parse/dtype the rest of the file.
             if file_path.endswith('.csv'):
-                df = pd.read_csv(file_path)
+                df = pd.read_csv(file_path, nrows=1)
             elif file_path.endswith(('.xlsx', '.xls')):
-                df = pd.read_excel(file_path)
+                df = pd.read_excel(file_path, nrows=1)
             else:
                 raise ValueError("Unsupported file format. Please use CSV or Excel files.")
             required_columns = {
@@ -84,10 +156,12 @@ class FileDataProcessor:
                 'industry': ['industry', 'Industry']
             }
 
-            #Extract data
+            #Extract data (column lookups are built once per file)
+            cols_set = set(df.columns)
+            lower_map = FileDataProcessor._lower_column_map(df)
             data = {}
             for param, possible_cols in required_columns.items():
-                value = FileDataProcessor._find_value_in_df(df, possible_cols)
+                value = FileDataProcessor._find_value_in_df(df, possible_cols, cols_set, lower_map)
                 if value is not None:
                     try:
                         data[param] = float(value)
@@ -102,20 +176,31 @@ class FileDataProcessor:
             raise ValueError(f"Error loading file {file_path}: {str(e)}")
 
     @staticmethod
-    def _find_value_in_df(df: pd.DataFrame, possible_columns: list) -> Optional[Union[float, str]]:
+    def _lower_column_map(df: pd.DataFrame) -> Dict[str, str]:
+        """Map lower-cased column names to the actual column name (first occurrence wins)."""
+        lower_map = {}
+        for c in df.columns:
+            lower_map.setdefault(str(c).lower(), c)
+        return lower_map
+
+    @staticmethod
+    def _find_value_in_df(df: pd.DataFrame, possible_columns: list, cols_set: Optional[set] = None,
+                          lower_map: Optional[Dict[str, str]] = None) -> Optional[Union[float, str]]:
         """Find value in DataFrame using multiple possible column names."""
+        if cols_set is None:
+            cols_set = set(df.columns)
+        if lower_map is None:
+            lower_map = FileDataProcessor._lower_column_map(df)
+
         # Check exact matches first
         for col in possible_columns:
-            if col in df.columns:
+            if col in cols_set:
                 return df[col].iloc[0]
 
         # Check case-insensitive matches
-        df_cols_lower = [c.lower() for c in df.columns]
         for col in possible_columns:
-            col_lower = col.lower()
-            if col_lower in df_cols_lower:
-                idx = df_cols_lower.index(col_lower)
-                actual_col = df.columns[idx]
+            actual_col = lower_map.get(col.lower())
+            if actual_col is not None:
                 return df[actual_col].iloc[0]
 
         return None
@@ -125,10 +210,11 @@ class DCFDataManager:
     def __init__(self):
         self.yahoo_processor = None
 
-    def load_from_yahoo(self, ticker: str, assumptions: Dict[str, float]) -> Dict[str, Union[float, str]]:
+    def load_from_yahoo(self, ticker: str, assumptions: Dict[str, float],
+                        include_info: bool = False) -> Dict[str, Union[float, str]]:
         """Load financial data from Yahoo Finance and combine with assumptions."""
         self.yahoo_processor = YahooFinanceDataProcessor(ticker)
-        financial_data = self.yahoo_processor.get_financial_data()
+        financial_data = self.yahoo_processor.get_financial_data(include_info)
 
         # Combine with user assumptions
         dcf_params = {**financial_data, **assumptions}
@@ -143,6 +229,10 @@ class DCFDataManager:
 
         return dcf_params
 
+    def load_industry(self, ticker: str) -> str:
+        """Load just the industry for a ticker (a separate, slower quote-summary request)."""
+        return YahooFinanceDataProcessor(ticker).get_industry()
+
     def load_from_file(self, file_path: str) -> Dict[str, Union[float, str]]:
         return FileDataProcessor.load_from_file(file_path)
 
@@ -159,11 +249,19 @@ class DCFDataManager:
             'industry': ['Technology'] # Added industry to template
         }
 
-        df = pd.DataFrame(template_data)
+        # Header row of parameter names and one row of values, written directly: no DataFrame
+        # and, for Excel, a write-only workbook that streams rows instead of building cell objects
+        header = list(template_data)
+        row = [values[0] for values in template_data.values()]
 
         if file_type.lower() == 'csv':
-            df.to_csv(file_path, index=False)
+            with open(file_path, 'w', newline='') as f:
+                csv.writer(f).writerows([header, row])
         elif file_type.lower() in ['xlsx', 'excel']:
-            df.to_excel(file_path, index=False)
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet('Sheet1')
+            ws.append(header)
+            ws.append(row)
+            wb.save(file_path)
         else:
             raise ValueError("Supported file types: 'csv', 'xlsx', 'excel'")
\ No newline at end of file
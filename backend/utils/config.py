@@ -1,3 +1,7 @@
+import os
+
+import numpy as np
+
 # Default parameters for Black-Scholes Model
 DEFAULT_PARAMS = {
     'S0': 50.0,      # Initial stock price
@@ -16,4 +20,24 @@ SIGMA_RANGE = {
     'price': (0.05, 0.81, 0.01),
 }
 
-K_RANGE = (20, 100.5, 0.5)  # (start, stop, step)
\ No newline at end of file
+K_RANGE = (20, 100.5, 0.5)  # (start, stop, step)
+
+# Points per sensitivity curve
+PLOT_POINTS = 512
+
+
+def _sweep(bounds, num=PLOT_POINTS):
+    """Read-only float32 sweep over a (start, stop, step) range; stop stays exclusive as with np.arange."""
+    start, stop, step = bounds
+    arr = np.linspace(start, stop - step, num, dtype=np.float32)
+    arr.setflags(write=False)
+    return arr
+
+
+# Sensitivity x-axes, built once and shared by every plot
+SIGMA_PRICE_ARR = _sweep(SIGMA_RANGE['price'])
+SIGMA_PROB_ARR = _sweep(SIGMA_RANGE['probability'])
+K_ARR = _sweep(K_RANGE)
+
+# On-disk cache for Yahoo Finance downloads (keyed by ticker and day)
+YF_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'bsm_sim', 'yfinance')
@@ -1,20 +1,39 @@
 import matplotlib.pyplot as plt
 
-def plot_sensitivity(x_values, y_values, title, xlabel, ylabel):
+# Reused across calls: creating a figure (backend init, font lookups) costs far more than redrawing one
+_fig, _ax = None, None
+
+
+def _get_axes():
+    """Return the shared Figure/Axes, recreating them if the window has been closed."""
+    global _fig, _ax
+    if _fig is None or not plt.fignum_exists(_fig.number):
+        _fig, _ax = plt.subplots(figsize=(10, 6))
+    return _fig, _ax
+
+
+def plot_sensitivity(x_values, y_values, title, xlabel, ylabel, block=True):
     """
     Generic plotting function for sensitivity analysis.
-    
+
     Args:
         x_values (array-like): Values for the x-axis
         y_values (array-like): Values for the y-axis
         title (str): Plot title
         xlabel (str): Label for the x-axis
         ylabel (str): Label for the y-axis
+        block (bool): Show the window and wait for it to be closed. Pass False in
+            sweeps to just redraw the shared figure and return immediately.
     """
-    plt.figure(figsize=(10, 6))
-    plt.plot(x_values, y_values, lw=2, color="blue")
-    plt.title(title, fontsize=16)
-    plt.xlabel(xlabel, fontsize=12)
-    plt.ylabel(ylabel, fontsize=12)
-    plt.grid(True)
-    plt.show()
\ No newline at end of file
+    fig, ax = _get_axes()
+    ax.clear()
+    ax.plot(x_values, y_values, lw=2, color="blue")
+    ax.set_title(title, fontsize=16)
+    ax.set_xlabel(xlabel, fontsize=12)
+    ax.set_ylabel(ylabel, fontsize=12)
+    ax.grid(True)
+    if block:
+        plt.show()
+    else:
+        fig.canvas.draw_idle()
+        fig.canvas.flush_events()
@@ -0,0 +1,729 @@
+"""
+The dashboard window: Black-Scholes plots, Monte Carlo runs and DCF valuation.
+
+Imported by gui.main() once the splash is on screen, since this pulls in the numerical
+stack, the Numba kernels and the Yahoo Finance/pandas data layer.
+"""
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+import numpy as np
+from scipy.special import ndtr
+import os
+import threading
+import warnings
+from functools import lru_cache
+import multiprocessing
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+try:
+    import numexpr as ne
+except ImportError:  # numexpr is optional; _bs_fused falls back to plain NumPy
+    ne = None
+from tkinterdnd2 import DND_FILES
+
+try:
+    # AOT-compiled sweep (see backend/kernels/_aot_build.py): native speed with no JIT on first plot
+    from backend.kernels.bs_kernels import bs_sweep_sigma
+    _warmup_sweep = None
+except ImportError:
+    from backend.kernels import bs_sweep_sigma
+    from backend.kernels.bs_njit import warmup as _warmup_sweep
+from backend.models import mc_pool
+from backend.models.black_scholes import BlackScholesModel
+from backend.models.DCF import DiscountedCashFlowModel
+from backend.models._dcf_kernels import project_and_discount, pv_at
+from backend.utils.config import DEFAULT_PARAMS, MC_SIMULATION_SIZES, SIGMA_PRICE_ARR, SIGMA_PROB_ARR, K_ARR
+from backend.utils.DataProcessor import DCFDataManager
+
+
+# One record per simulated size: n, MC price, analytical price, execution time
+MC_RESULT_DTYPE = np.dtype([('n', 'i8'), ('mc', 'f8'), ('an', 'f8'), ('t', 'f8')])
+
+# Sections and (key, label) rows of the DCF results panel; values are filled by display_dcf_results
+DCF_RESULT_LAYOUT = (
+    ("INPUT PARAMETERS", (
+        ('industry', "Industry"),
+        ('enterprise_value', "Enterprise Value"),
+        ('debt', "Total Debt"),
+        ('cash', "Cash & Equivalents"),
+        ('shares_outstanding', "Shares Outstanding"),
+        ('last_fcf', "Last Year FCF"),
+        ('growth_rate', "FCF Growth Rate"),
+        ('wacc', "WACC"),
+        ('terminal_growth_rate', "Terminal Growth"),
+        ('years', "Projection Years"),
+    )),
+    ("CALCULATED VALUES", (
+        ('intrinsic_ev', "Intrinsic Enterprise Value"),
+        ('terminal_value', "Terminal Value"),
+        ('intrinsic_equity', "Intrinsic Equity Value"),
+    )),
+    ("SHARE PRICE ANALYSIS", (
+        ('current_price', "Current Implied Price"),
+        ('intrinsic_value', "Intrinsic Value per Share"),
+        ('upside', "Upside/Downside"),
+    )),
+)
+
+# Per plot type: x-axis sweep and title/axis labels
+_PLOT_SPECS = {
+    'sigma_price': (SIGMA_PRICE_ARR, "Call Price vs. Volatility", "Volatility (σ)", "Call Price"),
+    'k_price': (K_ARR, "Call Price vs. Strike Price", "Strike Price (K)", "Call Price"),
+    'sigma_prob': (SIGMA_PROB_ARR, "P[ST > K] vs. Volatility", "Volatility (σ)", "P[ST > K]"),
+}
+
+
+def _bs_fused(S0, K, T, r, sigma, out=None):
+    """
+    Black-Scholes call price over a strike or volatility sweep with fused passes.
+
+    numexpr evaluates d1/d2 and the price expression in chunked single passes, so the only
+    full-size temporaries are d1 and d2 (turned into N(d1)/N(d2) in place).
+
+    Args:
+        S0, K, T, r, sigma: Model inputs; K or sigma may be a 1D array.
+        out (np.ndarray, optional): Buffer receiving the prices.
+
+    Returns:
+        np.ndarray: Call prices (``out`` when given).
+    """
+    if ne is None:
+        vol = sigma * np.sqrt(T)
+        d1 = (np.log(S0 / K) + (r + 0.5 * sigma**2) * T) / vol
+        d2 = d1 - vol
+        return np.subtract(S0 * ndtr(d1), K * np.exp(-r * T) * ndtr(d2), out=out)
+    local = {'S0': S0, 'K': K, 'T': T, 'r': r, 'sigma': sigma}
+    d1 = ne.evaluate("(log(S0 / K) + (r + 0.5 * sigma * sigma) * T) / (sigma * sqrt(T))", local_dict=local)
+    d2 = ne.evaluate("d1 - sigma * sqrt(T)", local_dict={'d1': d1, 'sigma': sigma, 'T': T})
+    ndtr(d1, out=d1)
+    ndtr(d2, out=d2)
+    local.update(d1=d1, d2=d2)
+    return ne.evaluate("S0 * d1 - K * exp(-r * T) * d2", local_dict=local, out=out)
+
+
+def _parse_sizes(text):
+    """Parse comma-separated positive simulation sizes; raises ValueError on anything else."""
+    # Empty tokens ("100,,200", ",100") are skipped, as with the old per-token parse
+    text = ','.join(t for t in text.split(',') if t.strip())
+    if not text:
+        return []
+    # Single C-level parse; older NumPy only warns on unparsable trailing data
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            sizes = np.fromstring(text, dtype=np.int64, sep=',')
+        except DeprecationWarning as e:
+            raise ValueError(str(e)) from None
+    if (sizes <= 0).any():
+        raise ValueError("sizes must be positive")
+    return sizes.tolist()
+
+
+def _clear_rows(tree):
+    """Remove every top-level row of a Treeview with a single delete call."""
+    children = tree.get_children()
+    if children:
+        tree.delete(*children)
+
+
+def _insert_rows(tree, rows):
+    """Append rows to a Treeview with direct Tcl calls, skipping ttk's per-insert option handling."""
+    call, path = tree.tk.call, str(tree)
+    for row in rows:
+        call(path, 'insert', '', 'end', '-values', row)
+
+
+@lru_cache(maxsize=64)
+def _compute_curve(plot_type, S0, K, T, r, sigma):
+    """
+    (x, y) arrays for a sensitivity plot, memoized on the scalar parameters.
+
+    Switching between plot types or replotting unchanged parameters reuses the cached
+    curve; the returned arrays are read-only since they are shared.
+    """
+    if plot_type not in _PLOT_SPECS:
+        raise ValueError(f"Unknown plot type: {plot_type}")
+    x_values = _PLOT_SPECS[plot_type][0]
+    # Plot precision doesn't need float64; float32 halves the bytes through log/exp/ndtr
+    S0, K, T, r, sigma = (np.float32(v) for v in (S0, K, T, r, sigma))
+    if plot_type == 'k_price':
+        # Fused numexpr passes over the strike sweep
+        y_values = _bs_fused(S0, x_values, T, r, sigma, out=np.empty_like(x_values))
+    else:
+        # Fused, parallel kernel over the volatility sweep
+        price, prob = bs_sweep_sigma(S0, K, T, r, x_values)
+        y_values = prob if plot_type == 'sigma_prob' else price
+    y_values.flags.writeable = False
+    return x_values, y_values
+
+
+@lru_cache(maxsize=1024)
+def _cached_analytics(S0, K, T, r, sigma):
+    """(P[S_T > K], call price) for scalar parameters, memoized across clicks and MC runs."""
+    model = BlackScholesModel(S0=S0, K=K, T=T, r=r, sigma=sigma)
+    return model.calculate_probability(), model.calculate_call_price()
+
+
+class FinanceDashboard:
+    def __init__(self, master):
+        self.master = master
+        master.title("Fintech & Stat Model Dashboard")
+        master.geometry("1200x1000")
+
+        if _warmup_sweep is not None:
+            # JIT the sweep kernel off the Tk thread while the window comes up
+            threading.Thread(target=_warmup_sweep, daemon=True).start()
+
+        self.notebook = ttk.Notebook(master)
+        self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        self.analytical_tab = ttk.Frame(self.notebook)
+        self.mc_tab = ttk.Frame(self.notebook)
+        self.dcf_tab = ttk.Frame(self.notebook)
+
+        self.notebook.add(self.analytical_tab, text='Black-Scholes Plots')
+        self.notebook.add(self.mc_tab, text='Monte Carlo Simulation')
+        self.notebook.add(self.dcf_tab, text='DCF Valuation')
+
+        self.create_analytical_tab(self.analytical_tab)
+        self.create_mc_tab(self.mc_tab)
+        self.create_dcf_tab(self.dcf_tab)
+
+        self.dcf_data_manager = DCFDataManager()
+        self.current_ticker_industry = "N/A"
+        # Counts Yahoo loads, so a late industry lookup only lands on the load (and results) it belongs to
+        self._yahoo_fetch = 0
+        self._dcf_results_fetch = None
+
+        # MC sizes run in worker processes (created on first use), off the Tk thread and the GIL
+        self._mc_pool = None
+        self._mc_pending = 0
+        self._mc_run = 0
+        self._mc_results = np.zeros(0, dtype=MC_RESULT_DTYPE)
+        self._mc_errors = {}
+        master.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        # Cancel queued MC sizes so closing the window doesn't wait on them
+        self._mc_run += 1
+        self._drop_mc_pool()
+        self.master.destroy()
+
+    def create_analytical_tab(self, parent):
+        left_pane = ttk.Frame(parent, width=350)
+        left_pane.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 10), pady=10, expand=False)
+        left_pane.pack_propagate(False)
+        self._plot_pane = ttk.Frame(parent)
+        self._plot_pane.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, pady=10)
+        controls_frame = ttk.LabelFrame(left_pane, text="Model Parameters", padding="10")
+        controls_frame.pack(fill=tk.X)
+        self.params = {}
+        # Plain-float mirror of the entries, kept current by write traces (see _track_float)
+        self._float_params = dict(DEFAULT_PARAMS)
+        self._dirty = set()
+        for i, (name, value) in enumerate(DEFAULT_PARAMS.items()):
+            ttk.Label(controls_frame, text=f"{name}:").grid(row=i, column=0, sticky=tk.W, padx=5, pady=5)
+            self.params[name] = tk.DoubleVar(value=value)
+            self._track_float(self.params[name], self._float_params, self._dirty, name)
+            ttk.Entry(controls_frame, textvariable=self.params[name], width=15).grid(row=i, column=1, sticky=tk.EW,
+                                                                                     padx=5, pady=5)
+        controls_frame.columnconfigure(1, weight=1)
+        actions_frame = ttk.LabelFrame(left_pane, text="Actions", padding="10")
+        actions_frame.pack(fill=tk.X, pady=10)
+        ttk.Button(actions_frame, text="Calculate Analytical Price", command=self.run_analytical_calc).pack(fill=tk.X,
+                                                                                                            pady=2)
+        ttk.Button(actions_frame, text="Plot Price vs. Sigma",
+                   command=lambda: self.plot_sensitivity('sigma_price')).pack(fill=tk.X, pady=2)
+        ttk.Button(actions_frame, text="Plot Price vs. Strike (K)",
+                   command=lambda: self.plot_sensitivity('k_price')).pack(fill=tk.X, pady=2)
+        ttk.Button(actions_frame, text="Plot Probability vs. Sigma",
+                   command=lambda: self.plot_sensitivity('sigma_prob')).pack(fill=tk.X, pady=2)
+        results_frame = ttk.LabelFrame(left_pane, text="Analytical Results", padding="10")
+        results_frame.pack(fill=tk.X)
+        self.result_prob = tk.StringVar()
+        self.result_price = tk.StringVar()
+        ttk.Label(results_frame, text="P[S_T > K]:").pack(anchor="w")
+        ttk.Label(results_frame, textvariable=self.result_prob, font=("Courier", 10)).pack(anchor="w", pady=(0, 5))
+        ttk.Label(results_frame, text="Call Price:").pack(anchor="w")
+        ttk.Label(results_frame, textvariable=self.result_price, font=("Courier", 10)).pack(anchor="w")
+        # The figure is built on the first plot (see _init_plot_canvas)
+        self.fig = self.ax = self.canvas = None
+
+    def _init_plot_canvas(self):
+        # matplotlib itself is only imported once a plot is requested
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        plt.style.use('dark_background')
+        self.fig = plt.figure(figsize=(8, 6))
+        self.ax = self.fig.add_subplot(111)
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self._plot_pane)
+        self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        self.ax.set_title("Select a plot to display")
+        self.ax.grid(True, which='both', linestyle='--', linewidth=0.5)
+        # Artists are created once and updated in place by plot_sensitivity. The curve is animated:
+        # it is blitted over a cached background instead of re-rendering axes, ticks and grid.
+        (self._line,) = self.ax.plot([], [], lw=2, color="#007bff", animated=True)
+        self._plot_msg = self.ax.text(0.5, 0.5, "", ha='center', va='center', transform=self.ax.transAxes)
+        self._plot_bg = None
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
+        self.canvas.draw()
+
+    def _on_canvas_draw(self, event):
+        # Every full redraw (first draw, resize, new limits or labels) refreshes the blit background
+        self._plot_bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        self.ax.draw_artist(self._line)
+
+    def _redraw_plot(self, static_changed):
+        if static_changed or self._plot_bg is None:
+            self.canvas.draw_idle()
+        else:
+            self.canvas.restore_region(self._plot_bg)
+            self.ax.draw_artist(self._line)
+            self.canvas.blit(self.ax.bbox)
+
+    def create_mc_tab(self, parent):
+        controls_pane = ttk.Frame(parent, width=350)
+        controls_pane.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 10), pady=10, expand=False)
+        controls_pane.pack_propagate(False)
+        results_pane = ttk.Frame(parent)
+        results_pane.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, pady=10)
+        sim_size_frame = ttk.LabelFrame(controls_pane, text="Select Simulation Sizes", padding="10")
+        sim_size_frame.pack(fill=tk.X)
+        self.mc_sim_vars = {}
+        for size in MC_SIMULATION_SIZES:
+            self.mc_sim_vars[size] = tk.BooleanVar(value=True)
+            cb = ttk.Checkbutton(sim_size_frame, text=f"{size:,}", variable=self.mc_sim_vars[size])
+            cb.pack(anchor='w', padx=5)
+        ttk.Separator(sim_size_frame, orient='horizontal').pack(fill='x', pady=10)
+        ttk.Label(sim_size_frame, text="Custom Sizes (comma-separated):").pack(anchor='w', padx=5)
+        self.custom_sizes_var = tk.StringVar()
+        self.custom_sizes_entry = ttk.Entry(sim_size_frame, textvariable=self.custom_sizes_var)
+        self.custom_sizes_entry.pack(fill='x', padx=5, pady=(0, 5))
+        ttk.Style().configure('Invalid.TEntry', foreground='red')
+        # Parsed once per edit; None while the text is invalid
+        self._custom_sizes = []
+        self.custom_sizes_var.trace_add('write', self._on_custom_sizes_change)
+        self.mc_qmc_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(sim_size_frame, text="Use QMC (Sobol)", variable=self.mc_qmc_var).pack(anchor='w', padx=5)
+        self.mc_run_btn = ttk.Button(controls_pane, text="Run Monte Carlo Simulation", command=self.run_mc_simulation)
+        self.mc_run_btn.pack(fill=tk.X, pady=20)
+        self.mc_table = ttk.Treeview(results_pane, columns=("n", "mc_price", "deviation_pct", "time"), show='headings')
+        self.mc_table.heading("n", text="Simulations (n)")
+        self.mc_table.heading("mc_price", text="MC Price")
+        self.mc_table.heading("deviation_pct", text="Deviation (%)")
+        self.mc_table.heading("time", text="Time (s)")
+        self.mc_table.pack(fill=tk.BOTH, expand=True)
+
+    def create_dcf_tab(self, parent):
+        controls_pane = ttk.Frame(parent, width=400)
+        controls_pane.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 10), pady=10, expand=False)
+        controls_pane.pack_propagate(False)
+        results_pane = ttk.Frame(parent)
+        results_pane.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, pady=10)
+        input_frame = ttk.LabelFrame(controls_pane, text="Data Input", padding="10")
+        input_frame.pack(fill=tk.X, pady=(0, 10))
+        yahoo_frame = ttk.Frame(input_frame)
+        yahoo_frame.pack(fill=tk.X, pady=(0, 10))
+        ttk.Label(yahoo_frame, text="Yahoo Finance Ticker:").pack(anchor='w')
+        ticker_frame = ttk.Frame(yahoo_frame)
+        ticker_frame.pack(fill=tk.X, pady=(2, 5))
+        self.ticker_var = tk.StringVar(value="AAPL")
+        ttk.Entry(ticker_frame, textvariable=self.ticker_var, width=10).pack(side=tk.LEFT, padx=(0, 5))
+        self.fetch_btn = ttk.Button(ticker_frame, text="Fetch Data", command=self.fetch_yahoo_data)
+        self.fetch_btn.pack(side=tk.LEFT)
+        ttk.Separator(input_frame, orient='horizontal').pack(fill='x', pady=10)
+        file_frame = ttk.LabelFrame(input_frame, text="File Import", padding="5")
+        file_frame.pack(fill=tk.X, pady=(0, 10))
+        self.drop_label = ttk.Label(file_frame, text="Drag & Drop CSV/Excel file here\nor click to browse",
+                                    padding=(10, 30), relief='sunken', anchor=tk.CENTER, justify=tk.CENTER)
+        self.drop_label.pack(fill=tk.X, pady=(0, 5))
+        self.drop_label.drop_target_register(DND_FILES)
+        self.drop_label.dnd_bind('<<Drop>>', self.on_file_drop)
+        self.drop_label.bind('<Button-1>', self.browse_file)
+        template_frame = ttk.Frame(file_frame)
+        template_frame.pack(fill=tk.X)
+        ttk.Button(template_frame, text="Generate CSV Template", command=lambda: self.generate_template('csv')).pack(
+            side=tk.LEFT, padx=(0, 5))
+        ttk.Button(template_frame, text="Generate Excel Template", command=lambda: self.generate_template('xlsx')).pack(
+            side=tk.LEFT)
+        params_frame = ttk.LabelFrame(controls_pane, text="DCF Parameters", padding="10")
+        params_frame.pack(fill=tk.X, pady=(0, 10))
+        self.dcf_params = {}
+        dcf_param_names = {'enterprise_value': 'Enterprise Value (M)', 'debt': 'Total Debt (M)',
+                           'cash': 'Cash & Equivalents (M)', 'shares_outstanding': 'Shares Outstanding (M)',
+                           'last_fcf': 'Last FCF (M)', 'growth_rate': 'FCF Growth Rate', 'wacc': 'WACC',
+                           'terminal_growth_rate': 'Terminal Growth Rate'}
+        default_values = {'enterprise_value': 1000.0, 'debt': 200.0, 'cash': 50.0, 'shares_outstanding': 100.0,
+                          'last_fcf': 60.0, 'growth_rate': 0.05, 'wacc': 0.08, 'terminal_growth_rate': 0.02}
+        self._dcf_float_params = dict(default_values)
+        self._dcf_dirty = set()
+        for i, (param, display_name) in enumerate(dcf_param_names.items()):
+            ttk.Label(params_frame, text=f"{display_name}:").grid(row=i, column=0, sticky=tk.W, padx=5, pady=2)
+            self.dcf_params[param] = tk.DoubleVar(value=default_values[param])
+            self._track_float(self.dcf_params[param], self._dcf_float_params, self._dcf_dirty, param)
+            entry = ttk.Entry(params_frame, textvariable=self.dcf_params[param], width=15)
+            entry.grid(row=i, column=1, sticky=tk.EW, padx=5, pady=2)
+        params_frame.columnconfigure(1, weight=1)
+        analysis_frame = ttk.LabelFrame(controls_pane, text="Analysis", padding="10")
+        analysis_frame.pack(fill=tk.X)
+        self.projection_years_var = tk.IntVar(value=5)
+        ttk.Label(analysis_frame, text="Projection Years:").pack(anchor='w')
+        ttk.Scale(analysis_frame, from_=3, to=10, variable=self.projection_years_var, orient=tk.HORIZONTAL,
+                  command=lambda s: self.projection_years_var.set(int(float(s)))).pack(fill=tk.X, pady=(0, 5))
+        ttk.Label(analysis_frame, textvariable=self.projection_years_var).pack(anchor='w', pady=(0, 10))
+        ttk.Button(analysis_frame, text="Calculate DCF", command=self.calculate_dcf).pack(fill=tk.X, pady=5)
+        results_frame = ttk.LabelFrame(results_pane, text="DCF Results", padding="10")
+        results_frame.pack(fill=tk.BOTH, expand=True)
+        # Labels are built once; display_dcf_results only sets the values
+        self.dcf_result_vars = {}
+        row = 0
+        for section, fields in DCF_RESULT_LAYOUT:
+            ttk.Label(results_frame, text=section, font=('Courier', 10, 'bold')).grid(
+                row=row, column=0, columnspan=2, sticky=tk.W, pady=(8 if row else 0, 2))
+            row += 1
+            for key, text in fields:
+                self.dcf_result_vars[key] = tk.StringVar()
+                ttk.Label(results_frame, text=f"{text}:", font=('Courier', 10)).grid(row=row, column=0, sticky=tk.W)
+                ttk.Label(results_frame, textvariable=self.dcf_result_vars[key], font=('Courier', 10)).grid(
+                    row=row, column=1, sticky=tk.E, padx=(10, 0))
+                row += 1
+        self.dcf_result_vars['summary'] = tk.StringVar()
+        ttk.Label(results_frame, textvariable=self.dcf_result_vars['summary'], font=('Courier', 10, 'bold')).grid(
+            row=row, column=0, columnspan=2, sticky=tk.W, pady=(8, 0))
+        table_frame = ttk.LabelFrame(results_pane, text="Cash Flow Projections", padding="10")
+        table_frame.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+        self.cf_table = ttk.Treeview(table_frame, columns=("year", "fcf", "pv_fcf"), show='headings', height=8)
+        self.cf_table.heading("year", text="Year");
+        self.cf_table.heading("fcf", text="Projected FCF");
+        self.cf_table.heading("pv_fcf", text="Present Value")
+        self.cf_table.column("year", width=80, anchor='center');
+        self.cf_table.column("fcf", width=120, anchor='e');
+        self.cf_table.column("pv_fcf", width=120, anchor='e')
+        self.cf_table.pack(fill=tk.BOTH, expand=True)
+
+    def run_analytical_calc(self):
+        try:
+            params = self._get_current_params()
+            probability, call_price = _cached_analytics(**params)
+            self.result_prob.set(f"{probability:.6f}")
+            self.result_price.set(f"{call_price:.6f}")
+        except Exception as e:
+            messagebox.showerror("Calculation Error", f"Error in calculation:\n{str(e)}")
+            self.result_prob.set("Error")
+            self.result_price.set("Error")
+
+    @staticmethod
+    def _track_float(var, store, dirty, key):
+        """Mirror a DoubleVar into store[key] on every write, so reads skip the Tcl round-trip."""
+        def on_write(*_):
+            try:
+                store[key] = var.get()
+                dirty.discard(key)
+            except tk.TclError:
+                # Unparsable while being edited; re-read (and report) when next used
+                dirty.add(key)
+        var.trace_add('write', on_write)
+
+    @staticmethod
+    def _read_floats(variables, store, dirty):
+        for name in list(dirty):
+            store[name] = variables[name].get()
+            dirty.discard(name)
+        return store.copy()
+
+    def _get_current_params(self):
+        return self._read_floats(self.params, self._float_params, self._dirty)
+
+    def _on_custom_sizes_change(self, *_):
+        try:
+            self._custom_sizes = _parse_sizes(self.custom_sizes_var.get())
+        except ValueError:
+            self._custom_sizes = None
+        self.custom_sizes_entry.configure(style='TEntry' if self._custom_sizes is not None else 'Invalid.TEntry')
+
+    def run_mc_simulation(self):
+        selected_sizes = {size for size, var in self.mc_sim_vars.items() if var.get()}
+        if self._custom_sizes is None:
+            messagebox.showerror("Invalid Input", "Custom sizes must be positive integers separated by commas.")
+            return
+        selected_sizes.update(self._custom_sizes)
+        if not selected_sizes:
+            messagebox.showwarning("No Selection", "Please select or enter at least one simulation size.")
+            return
+        _clear_rows(self.mc_table)
+        try:
+            params = self._get_current_params()
+            _, analytical_price = _cached_analytics(**params)
+        except Exception as e:
+            self.mc_table.insert("", "end", values=("Error", str(e), "", ""))
+            return
+        # Each size runs in a worker with an independent seed; rows are marshalled back onto
+        # the Tk thread as they finish
+        final_sizes = sorted(list(selected_sizes))
+        seeds = np.random.SeedSequence().spawn(len(final_sizes))
+        qmc = self.mc_qmc_var.get()
+        self.mc_run_btn.state(['disabled'])
+        self._mc_pending = len(final_sizes)
+        # Results land by index in a structured buffer and are formatted once at the end
+        self._mc_results = np.zeros(len(final_sizes), dtype=MC_RESULT_DTYPE)
+        self._mc_results['n'] = final_sizes
+        self._mc_results['an'] = analytical_price
+        self._mc_errors = {}
+        # Callbacks from an abandoned run (e.g. one whose pool broke mid-submit) are ignored
+        self._mc_run += 1
+        run = self._mc_run
+        # The largest size dominates the work, so it gets every core for its parallel kernel and
+        # starts first; the smaller sizes fan out across the remaining workers single-threaded
+        largest = len(final_sizes) - 1
+        omp = os.environ.get('OMP_NUM_THREADS')
+        try:
+            if self._mc_pool is None:
+                # spawn: forking a parent that already started Numba's thread pool can hang the workers
+                # Inherited by the workers, which import NumPy before any initializer could set it
+                os.environ['OMP_NUM_THREADS'] = '1'
+                self._mc_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=mc_pool.init_worker,
+                                                    mp_context=multiprocessing.get_context('spawn'))
+            for i in [largest, *range(largest)]:
+                threads = os.cpu_count() if i == largest else 1
+                fut = self._mc_pool.submit(mc_pool.price_size, params, final_sizes[i], seeds[i], qmc, threads)
+                fut.add_done_callback(lambda f, i=i: self._post_mc_done(run, i, f))
+        except Exception as e:
+            # A broken pool (a worker died) or a failed spawn: start over with a fresh pool next run
+            self._drop_mc_pool()
+            self._mc_run += 1
+            self._mc_pending = 0
+            self.mc_table.insert("", "end", values=("Error", str(e), "", ""))
+            self.mc_run_btn.state(['!disabled'])
+        finally:
+            # The workers copied the environment when they spawned on the first submit
+            if omp is None:
+                os.environ.pop('OMP_NUM_THREADS', None)
+            else:
+                os.environ['OMP_NUM_THREADS'] = omp
+
+    def _drop_mc_pool(self):
+        if self._mc_pool is not None:
+            self._mc_pool.shutdown(wait=False, cancel_futures=True)
+            self._mc_pool = None
+
+    def _post_mc_done(self, run, i, fut):
+        # Runs on the pool's thread; skip stale runs before touching Tk, which may be gone after close
+        if run == self._mc_run:
+            self.master.after(0, self._on_mc_done, run, i, fut)
+
+    def _on_mc_done(self, run, i, fut):
+        if run != self._mc_run:
+            return
+        error = CancelledError() if fut.cancelled() else fut.exception()
+        if error is None:
+            _, self._mc_results[i]['mc'], self._mc_results[i]['t'] = fut.result()
+        else:
+            if isinstance(error, BrokenProcessPool):
+                # Every later submit would raise too; the next run creates a new pool
+                self._drop_mc_pool()
+            self._mc_errors[i] = str(error)
+        self._on_mc_finished()
+
+    def _on_mc_finished(self):
+        self._mc_pending -= 1
+        if self._mc_pending == 0:
+            self._render_mc_results()
+
+    def _render_mc_results(self):
+        res = self._mc_results
+        # Price, deviation and time columns are formatted in NumPy's C loops rather than per-row f-strings
+        mc_strs = np.char.mod("%.6f", res['mc']).tolist()
+        t_strs = np.char.mod("%.4f", res['t']).tolist()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            deviations = (res['mc'] - res['an']) / res['an'] * 100
+        dev_strs = np.where(res['an'] != 0, np.char.mod("%+.2f%%", deviations), "N/A").tolist()
+        rows = [("Error", self._mc_errors[i], "", "") if i in self._mc_errors
+                else (f"{n:,}", mc_strs[i], dev_strs[i], t_strs[i])
+                for i, n in enumerate(res['n'].tolist())]
+        # Insert from an idle callback without forcing update_idletasks, so Tk coalesces
+        # the Treeview's redraws into a single layout pass after the whole batch
+        self.mc_table.after_idle(self._insert_mc_rows, rows)
+
+    def _insert_mc_rows(self, rows):
+        _insert_rows(self.mc_table, rows)
+        self.mc_run_btn.state(['!disabled'])
+
+    def plot_sensitivity(self, plot_type):
+        self.notebook.select(self.analytical_tab)
+        if self.canvas is None:
+            self._init_plot_canvas()
+        try:
+            params = self._get_current_params()
+            x_values, y_values = _compute_curve(plot_type, *(params[k] for k in ('S0', 'K', 'T', 'r', 'sigma')))
+            _, title, xlabel, ylabel = _PLOT_SPECS[plot_type]
+            static_before = (self.ax.get_title(), self.ax.get_xlim(), self.ax.get_ylim(), self._plot_msg.get_text())
+            self._line.set_data(x_values, y_values)
+            self._plot_msg.set_text("")
+            self.ax.set_title(title, fontsize=14)
+            self.ax.set_xlabel(xlabel, fontsize=10)
+            self.ax.set_ylabel(ylabel, fontsize=10)
+            self.ax.relim()
+            self.ax.autoscale_view()
+            static_after = (self.ax.get_title(), self.ax.get_xlim(), self.ax.get_ylim(), self._plot_msg.get_text())
+            self._redraw_plot(static_before != static_after)
+        except Exception as e:
+            self._line.set_data([], [])
+            self._plot_msg.set_text(f"Error generating plot:\n{e}")
+            self._redraw_plot(True)
+
+    def fetch_yahoo_data(self):
+        ticker = self.ticker_var.get().strip().upper()
+        if not ticker:
+            messagebox.showerror("Error", "Please enter a valid ticker symbol")
+            return
+        try:
+            # Only the three assumptions go to the loader, so only they need to parse
+            assumptions = {}
+            for k in ('growth_rate', 'wacc', 'terminal_growth_rate'):
+                if k in self._dcf_dirty:
+                    self._dcf_float_params[k] = self.dcf_params[k].get()
+                    self._dcf_dirty.discard(k)
+                assumptions[k] = self._dcf_float_params[k]
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to fetch data for {ticker}:\n{str(e)}")
+            return
+        # The download is network-bound; run it off the Tk thread and keep the button disabled meanwhile
+        self.fetch_btn.state(['disabled'])
+        threading.Thread(target=self._fetch_worker, args=(ticker, assumptions), daemon=True).start()
+
+    def _fetch_worker(self, ticker, assumptions):
+        try:
+            # Statements, shares and market cap come from the fast path; the industry follows separately
+            params = self.dcf_data_manager.load_from_yahoo(ticker, assumptions)
+        except Exception as e:
+            self.master.after(0, self._on_yahoo_error, ticker, e)
+        else:
+            self.master.after(0, self._apply_yahoo_params, ticker, params)
+
+    def _apply_yahoo_params(self, ticker, params):
+        self.fetch_btn.state(['!disabled'])
+        self.current_ticker_industry = params.get('industry', "N/A")
+        for param, value in params.items():
+            if param in self.dcf_params:
+                self.dcf_params[param].set(value)
+        self._yahoo_fetch += 1
+        threading.Thread(target=self._industry_worker, args=(ticker, self._yahoo_fetch), daemon=True).start()
+        messagebox.showinfo("Success", f"Data for {ticker} loaded successfully!")
+
+    def _industry_worker(self, ticker, fetch):
+        try:
+            industry = self.dcf_data_manager.load_industry(ticker)
+        except Exception:
+            # Only a display label; it stays "N/A"
+            return
+        self.master.after(0, self._apply_industry, fetch, industry)
+
+    def _apply_industry(self, fetch, industry):
+        if fetch != self._yahoo_fetch:
+            return
+        self.current_ticker_industry = industry
+        if self._dcf_results_fetch == fetch:
+            self.dcf_result_vars['industry'].set(industry)
+
+    def _on_yahoo_error(self, ticker, error):
+        self.fetch_btn.state(['!disabled'])
+        messagebox.showerror("Error", f"Failed to fetch data for {ticker}:\n{str(error)}")
+
+    def on_file_drop(self, event):
+        file_path = event.data
+        if file_path.startswith('{') and file_path.endswith('}'):
+            file_path = file_path[1:-1]
+        if os.path.exists(file_path):
+            self.load_file_data(file_path)
+        else:
+            messagebox.showerror("Error", f"Invalid file path: {file_path}")
+
+    def browse_file(self, event=None):
+        file_path = filedialog.askopenfilename(title="Select DCF Parameters File",
+                                               filetypes=[("CSV files", "*.csv"), ("Excel files", "*.xlsx"),
+                                                          ("All files", "*.*")])
+        if file_path:
+            self.load_file_data(file_path)
+
+    def load_file_data(self, file_path):
+        try:
+            self.drop_label.config(text=f"Loading: {os.path.basename(file_path)}")
+            self.master.update()
+            params = self.dcf_data_manager.load_from_file(file_path)
+            for param, value in params.items():
+                if param in self.dcf_params:
+                    self.dcf_params[param].set(value)
+            self.drop_label.config(text=f"Loaded: {os.path.basename(file_path)}")
+            messagebox.showinfo("Success", f"Data loaded from {os.path.basename(file_path)}")
+        except Exception as e:
+            self.drop_label.config(text="Drag & Drop CSV/Excel file here\nor click to browse")
+            messagebox.showerror("Error", f"Failed to load file:\n{str(e)}")
+
+    def generate_template(self, file_type):
+        try:
+            file_path = filedialog.asksaveasfilename(title=f"Save {file_type.upper()} Template",
+                                                     defaultextension=f'.{file_type}',
+                                                     filetypes=[(f"{file_type.upper()} files", f"*.{file_type}")])
+            if file_path:
+                self.dcf_data_manager.create_template_file(file_path, file_type)
+                messagebox.showinfo("Success", f"Template saved to {os.path.basename(file_path)}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to create template:\n{str(e)}")
+
+    def calculate_dcf(self):
+        """Calculate DCF valuation."""
+        try:
+            params = self._read_floats(self.dcf_params, self._dcf_float_params, self._dcf_dirty)
+            # --- FIXED : Use projection_years_var instead of hardcoded 5 ---
+            years = self.projection_years_var.get()
+            #store industry
+            params['industry'] = self.current_ticker_industry
+
+            dcf_model = DiscountedCashFlowModel(**params)
+            intrinsic_value = dcf_model.calculate_intrinsic_value(years)
+            current_implied_price = dcf_model.calculate_implied_share_price()
+            # Projection, terminal value and discounting in one compiled pass
+            projected_fcf, terminal_value, intrinsic_enterprise_value = project_and_discount(
+                float(dcf_model.last_fcf), float(dcf_model.growth_rate), float(dcf_model.wacc),
+                float(dcf_model.terminal_growth_rate), int(years))
+
+            self.display_dcf_results(dcf_model, intrinsic_value, current_implied_price, intrinsic_enterprise_value,
+                                     terminal_value, years)
+            self._dcf_results_fetch = self._yahoo_fetch
+            self.update_cf_table(projected_fcf, dcf_model.wacc, terminal_value, years)
+        except Exception as e:
+            messagebox.showerror("Calculation Error", f"Error in DCF calculation:\n{str(e)}")
+
+    def display_dcf_results(self, dcf_model, intrinsic_value, current_price, enterprise_value, terminal_value, years):
+        values = {
+            'industry': dcf_model.industry,
+            'enterprise_value': f"${dcf_model.enterprise_value:,.0f}M",
+            'debt': f"${dcf_model.debt:,.0f}M",
+            'cash': f"${dcf_model.cash:,.0f}M",
+            'shares_outstanding': f"{dcf_model.shares_outstanding:,.0f}M",
+            'last_fcf': f"${dcf_model.last_fcf:,.0f}M",
+            'growth_rate': f"{dcf_model.growth_rate:.2%}",
+            'wacc': f"{dcf_model.wacc:.2%}",
+            'terminal_growth_rate': f"{dcf_model.terminal_growth_rate:.2%}",
+            'years': f"{years}",
+            'intrinsic_ev': f"${enterprise_value:,.0f}M",
+            'terminal_value': f"${terminal_value:,.0f}M",
+            'intrinsic_equity': f"${enterprise_value - dcf_model.debt + dcf_model.cash:,.0f}M",
+            'current_price': f"${current_price:.2f}",
+            'intrinsic_value': f"${intrinsic_value:.2f}",
+            'upside': f"{((intrinsic_value - current_price) / current_price * 100):+.1f}%",
+            'summary': (f"{'UNDERVALUED' if intrinsic_value > current_price else 'OVERVALUED'} "
+                        f"by ${abs(intrinsic_value - current_price):.2f} per share"),
+        }
+        for key, value in values.items():
+            self.dcf_result_vars[key].set(value)
+
+    def update_cf_table(self, projected_fcf, wacc, terminal_value, years):
+        _clear_rows(self.cf_table)
+        fcf = np.asarray(projected_fcf, dtype=np.float64)
+        pv = pv_at(fcf, wacc, np.arange(1, len(fcf) + 1))
+        year_strs = [f"Year {year}" for year in range(1, len(fcf) + 1)]
+        rows = list(zip(year_strs, np.char.mod("$%.1fM", fcf).tolist(), np.char.mod("$%.1fM", pv).tolist()))
+        pv_terminal = terminal_value / ((1 + wacc) ** years)
+        rows.append(("Terminal", f"${terminal_value:.1f}M", f"${pv_terminal:.1f}M"))
+        _insert_rows(self.cf_table, rows)
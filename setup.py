@@ -8,7 +8,7 @@ OPTIONS = {
     'iconfile': 'backend/assets/icon.icns',
     'packages': [
         'backend', 'numpy', 'pandas', 'scipy',
-        'yfinance', 'matplotlib', 'sv_ttk',
+        'yfinance', 'joblib', 'matplotlib', 'sv_ttk',
         'tkinterdnd2', 'openpyxl'
     ],
 
@@ -32,8 +32,22 @@ OPTIONS = {
 # NOTE: The monkey-patch and 'excludes' for setuptools are no longer needed
 # with modern py2app and can sometimes cause issues. This is a cleaner setup.
 
+# Optional native kernels; the app falls back to JIT/NumPy paths when they are not built
+ext_modules = []
+try:
+    from backend.models._mc_aot import cc as mc_cc
+    ext_modules.append(mc_cc.distutils_extension())
+except ImportError:
+    pass
+try:
+    from backend.kernels._aot_build import cc as bs_cc
+    ext_modules.append(bs_cc.distutils_extension())
+except ImportError:
+    pass
+
 setup(
     app=APP,
     options={'py2app': OPTIONS},
     setup_requires=['py2app'],
+    ext_modules=ext_modules,
 )
\ No newline at end of file